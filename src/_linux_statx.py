@@ -0,0 +1,117 @@
+"""
+statx(2) for Linux (kernel 4.11+, glibc 2.28+), called through ctypes.
+
+Used by the scanner instead of os.stat(): with AT_STATX_DONT_SYNC, network
+filesystems (NFS, SMB/CIFS) may answer from their attribute cache instead of
+revalidating every file with the server, and the mask asks only for the fields
+the grid shows.
+"""
+import ctypes
+import errno
+import os
+import sys
+from typing import Optional, Tuple
+
+AT_FDCWD = -100
+AT_SYMLINK_NOFOLLOW = 0x100
+AT_STATX_DONT_SYNC = 0x4000
+
+STATX_ATIME = 0x20
+STATX_MTIME = 0x40
+STATX_CTIME = 0x80
+STATX_SIZE = 0x200
+STATX_WANTED = STATX_SIZE | STATX_ATIME | STATX_MTIME | STATX_CTIME
+
+
+class _StatxTimestamp(ctypes.Structure):
+    _fields_ = [
+        ("tv_sec", ctypes.c_int64),
+        ("tv_nsec", ctypes.c_uint32),
+        ("_reserved", ctypes.c_int32),
+    ]
+
+
+class _Statx(ctypes.Structure):
+    # struct statx from <linux/stat.h>; 256 bytes in total
+    _fields_ = [
+        ("stx_mask", ctypes.c_uint32),
+        ("stx_blksize", ctypes.c_uint32),
+        ("stx_attributes", ctypes.c_uint64),
+        ("stx_nlink", ctypes.c_uint32),
+        ("stx_uid", ctypes.c_uint32),
+        ("stx_gid", ctypes.c_uint32),
+        ("stx_mode", ctypes.c_uint16),
+        ("_spare0", ctypes.c_uint16),
+        ("stx_ino", ctypes.c_uint64),
+        ("stx_size", ctypes.c_uint64),
+        ("stx_blocks", ctypes.c_uint64),
+        ("stx_attributes_mask", ctypes.c_uint64),
+        ("stx_atime", _StatxTimestamp),
+        ("stx_btime", _StatxTimestamp),
+        ("stx_ctime", _StatxTimestamp),
+        ("stx_mtime", _StatxTimestamp),
+        ("_spare", ctypes.c_uint8 * 128),   # stx_rdev_*, stx_dev_*, stx_mnt_id, dio fields, __spare3
+    ]
+
+
+_statx_fn = None
+_available: Optional[bool] = None
+
+
+def _ts(t: _StatxTimestamp) -> float:
+    return t.tv_sec + t.tv_nsec / 1e9
+
+
+def statx(dirfd: int, path: str, flags: int, mask: int) -> Tuple[int, float, float, float]:
+    """
+    Returns (size, atime, mtime, ctime) for path. Raises OSError on failure.
+    Only call after available() returned True.
+    """
+    buf = _Statx()
+    if _statx_fn(dirfd, os.fsencode(path), flags, mask, ctypes.byref(buf)) != 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err), path)
+    if buf.stx_mask & mask != mask:
+        # filesystem couldn't supply every field we asked for
+        st = os.stat(path, follow_symlinks=not (flags & AT_SYMLINK_NOFOLLOW))
+        return st.st_size, st.st_atime, st.st_mtime, st.st_ctime
+    return buf.stx_size, _ts(buf.stx_atime), _ts(buf.stx_mtime), _ts(buf.stx_ctime)
+
+
+def stat_file(path: str) -> Tuple[int, float, float, float]:
+    """
+    (size, atime, mtime, ctime) of path, following symlinks like os.stat().
+    """
+    return statx(AT_FDCWD, path, AT_STATX_DONT_SYNC, STATX_WANTED)
+
+
+def available() -> bool:
+    """
+    Whether statx can be used here; probed once, then cached.
+    """
+    global _available
+    if _available is None:
+        _available = _probe()
+    return _available
+
+
+def _probe() -> bool:
+    global _statx_fn
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        fn = ctypes.CDLL("libc.so.6", use_errno=True).statx
+    except (OSError, AttributeError):
+        # not glibc, or glibc older than 2.28
+        return False
+    fn.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_uint, ctypes.POINTER(_Statx)]
+    fn.restype = ctypes.c_int
+    _statx_fn = fn
+    try:
+        stat_file("/")
+    except OSError as e:
+        # ENOSYS: kernel older than 4.11 (or statx blocked by a seccomp filter)
+        if e.errno == errno.ENOSYS or e.errno == errno.EPERM:
+            _statx_fn = None
+            return False
+    return True
@@ -0,0 +1,151 @@
+"""
+Directory listing for macOS through getattrlistbulk(2) (macOS 10.10+), called via ctypes.
+
+One getattrlistbulk call returns name, type, size and timestamps for many
+entries at once, where os.scandir + DirEntry.stat() needs a getattrlist/stat
+round trip per file.
+"""
+import ctypes
+import os
+import struct
+import sys
+from typing import List, Optional, Tuple
+
+ATTR_BIT_MAP_COUNT = 5
+
+ATTR_CMN_NAME = 0x00000001
+ATTR_CMN_OBJTYPE = 0x00000008
+ATTR_CMN_MODTIME = 0x00000400
+ATTR_CMN_CHGTIME = 0x00000800
+ATTR_CMN_ACCTIME = 0x00001000
+ATTR_CMN_RETURNED_ATTRS = 0x80000000
+ATTR_FILE_DATALENGTH = 0x00000200
+
+# fsobj_type_t values
+VREG = 1
+VDIR = 2
+VLNK = 5
+
+_BUF_SIZE = 64 * 1024
+
+# entry header: u_int32 length, then the returned attribute_set_t (5 x u_int32)
+_HEADER = struct.Struct("=6I")
+_ATTRREF = struct.Struct("=iI")    # attrreference_t: offset (from itself), length incl. NUL
+_U32 = struct.Struct("=I")
+_TIMESPEC = struct.Struct("=qq")   # 64-bit tv_sec, tv_nsec
+_OFF_T = struct.Struct("=q")
+
+
+class _AttrList(ctypes.Structure):
+    _fields_ = [
+        ("bitmapcount", ctypes.c_ushort),
+        ("reserved", ctypes.c_uint16),
+        ("commonattr", ctypes.c_uint32),
+        ("volattr", ctypes.c_uint32),
+        ("dirattr", ctypes.c_uint32),
+        ("fileattr", ctypes.c_uint32),
+        ("forkattr", ctypes.c_uint32),
+    ]
+
+
+_getattrlistbulk = None
+_available: Optional[bool] = None
+
+# (name, objtype, size, atime, mtime, ctime)
+Entry = Tuple[str, int, int, float, float, float]
+
+
+def list_dir(dirpath: str) -> List[Entry]:
+    """
+    Lists one directory. size is 0 for anything but regular files.
+    Raises OSError on failure. Only call after available() returned True.
+    """
+    alist = _AttrList()
+    alist.bitmapcount = ATTR_BIT_MAP_COUNT
+    alist.commonattr = (
+        ATTR_CMN_RETURNED_ATTRS | ATTR_CMN_NAME | ATTR_CMN_OBJTYPE |
+        ATTR_CMN_MODTIME | ATTR_CMN_CHGTIME | ATTR_CMN_ACCTIME
+    )
+    alist.fileattr = ATTR_FILE_DATALENGTH
+    buf = ctypes.create_string_buffer(_BUF_SIZE)
+
+    entries: List[Entry] = []
+    fd = os.open(dirpath, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        while True:
+            count = _getattrlistbulk(fd, ctypes.byref(alist), buf, _BUF_SIZE, 0)
+            if count < 0:
+                err = ctypes.get_errno()
+                raise OSError(err, os.strerror(err), dirpath)
+            if count == 0:
+                break
+            _decode(buf, count, entries)
+    finally:
+        os.close(fd)
+    return entries
+
+
+def _decode(buf, count: int, out: List[Entry]):
+    off = 0
+    for _ in range(count):
+        length, common, _vol, _dir, fileattr, _fork = _HEADER.unpack_from(buf, off)
+        p = off + _HEADER.size
+        name = ""
+        objtype = 0
+        size = 0
+        atime = mtime = ctime = 0.0
+
+        # attributes follow in bit order, only those flagged as returned
+        if common & ATTR_CMN_NAME:
+            name_off, name_len = _ATTRREF.unpack_from(buf, p)
+            name = os.fsdecode(buf[p + name_off:p + name_off + name_len - 1])
+            p += _ATTRREF.size
+        if common & ATTR_CMN_OBJTYPE:
+            objtype = _U32.unpack_from(buf, p)[0]
+            p += _U32.size
+        if common & ATTR_CMN_MODTIME:
+            sec, nsec = _TIMESPEC.unpack_from(buf, p)
+            mtime = sec + nsec / 1e9
+            p += _TIMESPEC.size
+        if common & ATTR_CMN_CHGTIME:
+            sec, nsec = _TIMESPEC.unpack_from(buf, p)
+            ctime = sec + nsec / 1e9
+            p += _TIMESPEC.size
+        if common & ATTR_CMN_ACCTIME:
+            sec, nsec = _TIMESPEC.unpack_from(buf, p)
+            atime = sec + nsec / 1e9
+            p += _TIMESPEC.size
+        if fileattr & ATTR_FILE_DATALENGTH:
+            size = _OFF_T.unpack_from(buf, p)[0]
+
+        out.append((name, objtype, size, atime, mtime, ctime))
+        off += length
+
+
+def available() -> bool:
+    """
+    Whether getattrlistbulk can be used here; probed once, then cached.
+    """
+    global _available
+    if _available is None:
+        _available = _probe()
+    return _available
+
+
+def _probe() -> bool:
+    global _getattrlistbulk
+    if sys.platform != "darwin":
+        return False
+    try:
+        fn = ctypes.CDLL("libc.dylib", use_errno=True).getattrlistbulk
+    except (OSError, AttributeError):
+        return False
+    fn.argtypes = [ctypes.c_int, ctypes.POINTER(_AttrList), ctypes.c_void_p, ctypes.c_size_t, ctypes.c_uint64]
+    fn.restype = ctypes.c_int
+    _getattrlistbulk = fn
+    try:
+        list_dir("/")
+    except OSError:
+        _getattrlistbulk = None
+        return False
+    return True
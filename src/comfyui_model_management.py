@@ -1,12 +1,28 @@
 import os
 import sys
+import time
 import traceback
-from dataclasses import dataclass
+from array import array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache, partial
+from itertools import compress, repeat
+from operator import and_, attrgetter, contains, methodcaller, or_
 from pathlib import Path
-from typing import List, Optional, Tuple
-
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QSize, QTimer, QSettings
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+from PyQt6.QtCore import (
+    Qt,
+    QThread,
+    QTimer,
+    pyqtSignal,
+    QSize,
+    QSettings,
+    QAbstractTableModel,
+    QModelIndex,
+)
 from PyQt6.QtGui import QColor, QPalette
 from PyQt6.QtWidgets import (
     QApplication,
@@ -17,8 +33,7 @@ from PyQt6.QtWidgets import (
     QLineEdit,
     QPushButton,
     QFileDialog,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QHeaderView,
     QMessageBox,
     QProgressBar,
@@ -32,7 +47,25 @@ from PyQt6.QtWidgets import (
 from openpyxl import Workbook
 from openpyxl.utils import get_column_letter
 
+import _linux_statx
+import _macos_scanner
+
 MODEL_EXTS = {".safetensors", ".ckpt", ".pth", ".pt", ".onnx", ".bin", ".gguf"}
+# str.endswith(tuple) does the suffix test in C; entries are already lowercase
+MODEL_EXTS_TUPLE = tuple(MODEL_EXTS)
+
+# scan rows are handed to the GUI thread in batches of this size (or sooner, see below)
+SCAN_BATCH_SIZE = 256
+SCAN_BATCH_INTERVAL = 0.05  # seconds
+
+# typing into the filter refreshes the grid once the user pauses this long
+FILTER_DEBOUNCE_MS = 150
+
+# directory names the scan never descends into: they don't hold model weights
+# (.git also covers custom_nodes/*/.git). Overridable via the scan_skip_dirs setting.
+SKIP_DIRS = frozenset({".git", "__pycache__", "node_modules", ".venv", "venv", "web"})
+
+HEADERS = ["Directory", "Name", "Length", "LastAccessTime", "LastWriteTime", "CreationTime"]
 
 
 # ---------------- Utilities ----------------
@@ -44,41 +77,231 @@ def fmt_dt(ts: float) -> str:
         return ""
 
 
-def parse_dt(s: str) -> Optional[datetime]:
-    try:
-        return datetime.strptime(s, "%Y-%m-%d %H:%M:%S")
-    except Exception:
-        return None
+# the grid formats the same timestamps again on every repaint, scroll and re-sort;
+# the export formats each one once, so it calls fmt_dt directly and leaves the cache alone
+fmt_dt_cached = lru_cache(maxsize=16384)(fmt_dt)
+
+
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB")
+_BYTE_DIVS = (1, 1024, 1024 ** 2, 1024 ** 3, 1024 ** 4)
+_BYTE_DECIMALS = (0, 1, 1, 2, 2)
 
 
 def fmt_bytes(n: int) -> str:
     n = int(n)
-    if n < 1024:
+    # each unit is 2**10 of the previous one, so the bit length picks it directly
+    idx = min(4, max(0, (n.bit_length() - 1) // 10))
+    if idx == 0:
         return f"{n} B"
-    kb = n / 1024
-    if kb < 1024:
-        return f"{kb:.1f} KB"
-    mb = kb / 1024
-    if mb < 1024:
-        return f"{mb:.1f} MB"
-    gb = mb / 1024
-    if gb < 1024:
-        return f"{gb:.2f} GB"
-    tb = gb / 1024
-    return f"{tb:.2f} TB"
+    return f"{n / _BYTE_DIVS[idx]:.{_BYTE_DECIMALS[idx]}f} {_BYTE_UNITS[idx]}"
+
+
+def combine_masks(op, a: bytearray, b: bytearray) -> bytearray:
+    """
+    and_/or_ of two equally long 0/1 byte masks, done on them as two big integers
+    (bytewise, since every byte is 0 or 1) instead of looping over the bytes.
+    """
+    return bytearray(op(int.from_bytes(a, "little"), int.from_bytes(b, "little")).to_bytes(len(a), "little"))
+
+
+def insert_at(seq: list, positions: List[int], items: list) -> list:
+    """
+    Copy of seq with items[j] inserted before seq[positions[j]] (positions ascending;
+    equal positions keep items in their order). Copies whole slices between the
+    insertion points, so the Python work is per item, not per element of seq.
+    """
+    out = []
+    prev = 0
+    for p, x in zip(positions, items):
+        out += seq[prev:p]
+        out.append(x)
+        prev = p
+    out += seq[prev:]
+    return out
+
+
+def _stat_entry_os(entry: os.DirEntry) -> Tuple[int, float, float, float]:
+    st = entry.stat()
+    return st.st_size, st.st_atime, st.st_mtime, st.st_ctime
+
+
+def _stat_entry_statx(entry: os.DirEntry) -> Tuple[int, float, float, float]:
+    return _linux_statx.stat_file(entry.path)
+
+
+# (size, atime, mtime, ctime) of a scandir entry, following symlinks like entry.stat()
+stat_entry = _stat_entry_statx if _linux_statx.available() else _stat_entry_os
 
 
 # ---------------- Data ----------------
 
-@dataclass
-class FileRow:
+class FileRow(NamedTuple):
+    # a plain tuple underneath: cheap to build in the scanner, and ScanResults.extend
+    # splits a batch into its columns with one zip()
     full_path: str        # internal use only
     directory: str
     name: str
     length: int
-    last_access_time: str
-    last_write_time: str
-    creation_time: str
+    atime: float          # raw timestamps; formatted only for display/export
+    mtime: float
+    ctime: float
+
+
+@dataclass
+class ScanResults:
+    """
+    All scan results, stored column-wise: one list/array per field, indexed by row id.
+    Sizes and timestamps live in typed arrays (8 bytes per row, no per-row objects).
+    Each distinct directory is stored once in dir_table and rows refer to it by
+    dir_ids. Lowercased copies are computed once so filtering never calls lower().
+    Deleted rows are only marked dead (see remove_paths); ids() lists the live ones.
+    """
+    full_paths: List[str] = field(default_factory=list)
+    names: List[str] = field(default_factory=list)
+    dir_ids: array = field(default_factory=lambda: array("i"))
+    sizes: array = field(default_factory=lambda: array("q"))
+    atimes: array = field(default_factory=lambda: array("d"))
+    mtimes: array = field(default_factory=lambda: array("d"))
+    ctimes: array = field(default_factory=lambda: array("d"))
+    names_lower: List[str] = field(default_factory=list)
+    dir_table: List[str] = field(default_factory=list)
+    dir_table_lower: List[str] = field(default_factory=list)
+    dir_index: Dict[str, int] = field(default_factory=dict)
+
+    # filter token -> how many rows it matched last time; rarest tokens are tried first
+    _token_hits: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    # per row: rank of its lowercased directory, so sorting by directory compares ints;
+    # built on first directory sort, dropped whenever rows are added
+    _dir_keys: Optional[array] = field(default=None, init=False, repr=False)
+    # deletions: path -> row id (built on first delete), 1 = live per row (None = all live)
+    _row_by_path: Optional[Dict[str, int]] = field(default=None, init=False, repr=False)
+    _alive: Optional[bytearray] = field(default=None, init=False, repr=False)
+    _dead: int = field(default=0, init=False, repr=False)
+
+    def __len__(self) -> int:
+        # number of row ids, dead rows included
+        return len(self.full_paths)
+
+    def live_count(self) -> int:
+        return len(self.full_paths) - self._dead
+
+    def live_mask(self) -> Optional[bytearray]:
+        """
+        One byte per row id, 1 = live; None while no row has been deleted.
+        """
+        return self._alive
+
+    def ids(self) -> List[int]:
+        """
+        Live row ids, ascending.
+        """
+        if self._alive is None:
+            return list(range(len(self.full_paths)))
+        return list(compress(range(len(self._alive)), self._alive))
+
+    def dir_of(self, i: int) -> str:
+        return self.dir_table[self.dir_ids[i]]
+
+    def extend(self, rows: List[FileRow]):
+        if not rows:
+            return
+        full_paths, directories, names, sizes, atimes, mtimes, ctimes = zip(*rows)
+        dir_index = self.dir_index
+        dir_ids = self.dir_ids
+        for d in directories:
+            di = dir_index.get(d)
+            if di is None:
+                di = dir_index[d] = len(self.dir_table)
+                self.dir_table.append(d)
+                self.dir_table_lower.append(d.lower())
+            dir_ids.append(di)
+        self.full_paths.extend(full_paths)
+        self.names.extend(names)
+        self.sizes.extend(sizes)
+        self.atimes.extend(atimes)
+        self.mtimes.extend(mtimes)
+        self.ctimes.extend(ctimes)
+        self.names_lower.extend(map(str.lower, names))
+        self._token_hits = {}
+        self._dir_keys = None
+        self._row_by_path = None
+        if self._alive is not None:
+            self._alive.extend(b"\x01" * (len(self.full_paths) - len(self._alive)))
+
+    def dir_sort_keys(self) -> array:
+        """
+        Sort key per row id for the directory column (same order as the lowercased directory).
+        """
+        if self._dir_keys is None:
+            lowered = self.dir_table_lower
+            rank = {d: r for r, d in enumerate(sorted(set(lowered)))}
+            dir_rank = [rank[d] for d in lowered]
+            self._dir_keys = array("i", [dir_rank[di] for di in self.dir_ids])
+        return self._dir_keys
+
+    def match_mask(self, needle: str) -> bytearray:
+        """
+        One byte per row id: 1 where the row is live and its directory or name contains
+        every whitespace-separated token of needle (already lowercased).
+        """
+        n = len(self)
+        token_hits = self._token_hits
+        tokens = sorted(set(needle.split()), key=lambda t: (token_hits.get(t, n), -len(t)))
+
+        mask = self._alive
+        for t in tokens:
+            t_mask = self._token_mask(t)
+            token_hits[t] = t_mask.count(1)
+            mask = t_mask if mask is None else combine_masks(and_, mask, t_mask)
+            if 1 not in mask:
+                break
+        if mask is None:
+            return bytearray(b"\x01") * n
+        return mask if mask is not self._alive else bytearray(mask)
+
+    def _token_mask(self, needle: str) -> bytearray:
+        # `needle in name` for every row in one C-level map, no Python loop per row
+        mask = bytearray(map(contains, self.names_lower, repeat(needle)))
+        # many rows share a directory: test each directory once, then spread the result
+        dir_hit = bytes(needle in d for d in self.dir_table_lower)
+        if 1 in dir_hit:
+            mask = combine_masks(or_, mask, bytearray(map(dir_hit.__getitem__, self.dir_ids)))
+        return mask
+
+    def remove_paths(self, paths: List[str]) -> "ScanResults":
+        """
+        Drops the rows of paths. They are only marked dead, which costs O(len(paths));
+        once dead rows pass a quarter of the store, a compacted copy is built instead.
+        Returns the store to use from now on (self, or the compacted copy).
+        """
+        if self._row_by_path is None:
+            self._row_by_path = {p: i for i, p in enumerate(self.full_paths)}
+        if self._alive is None:
+            self._alive = bytearray(b"\x01") * len(self.full_paths)
+        for p in paths:
+            i = self._row_by_path.pop(p, None)
+            if i is not None:
+                self._alive[i] = 0
+                self._dead += 1
+        if self._dead * 4 > len(self.full_paths):
+            return self._compacted()
+        return self
+
+    def _compacted(self) -> "ScanResults":
+        keep = self.ids()
+        return ScanResults(
+            full_paths=[self.full_paths[i] for i in keep],
+            names=[self.names[i] for i in keep],
+            dir_ids=array("i", [self.dir_ids[i] for i in keep]),
+            sizes=array("q", [self.sizes[i] for i in keep]),
+            atimes=array("d", [self.atimes[i] for i in keep]),
+            mtimes=array("d", [self.mtimes[i] for i in keep]),
+            ctimes=array("d", [self.ctimes[i] for i in keep]),
+            names_lower=[self.names_lower[i] for i in keep],
+            dir_table=list(self.dir_table),
+            dir_table_lower=list(self.dir_table_lower),
+            dir_index=dict(self.dir_index),
+        )
 
 
 # ---------------- Workers ----------------
@@ -86,18 +309,20 @@ class FileRow:
 class ScanWorker(QThread):
     """
     Streaming scan:
-    - row_found emits each FileRow as soon as it is read
-    - progress emits 0..100 based on processed candidates
+    - rows_found emits FileRows in batches of SCAN_BATCH_SIZE, or every
+      SCAN_BATCH_INTERVAL seconds, whichever comes first
+    - progress emits -1 (busy, total unknown) while walking, then 100
     """
     progress = pyqtSignal(int)
     status = pyqtSignal(str)
-    row_found = pyqtSignal(object)   # FileRow
+    rows_found = pyqtSignal(list)    # List[FileRow]
     done = pyqtSignal(int)           # total
     error = pyqtSignal(str)
 
-    def __init__(self, root_dir: str, parent=None):
+    def __init__(self, root_dir: str, skip_dirs=SKIP_DIRS, parent=None):
         super().__init__(parent)
         self.root_dir = root_dir
+        self.skip_dirs = frozenset(skip_dirs)
         self._stop = False
 
     def request_stop(self):
@@ -110,51 +335,118 @@ class ScanWorker(QThread):
                 self.error.emit("Please select a valid ComfyUI directory.")
                 return
 
-            self.status.emit("Scanning: counting candidate files...")
-            candidates: List[Path] = []
-            for dirpath, _, filenames in os.walk(root):
-                if self._stop:
-                    return
-                for fn in filenames:
+            self.status.emit("Scanning...")
+            self.progress.emit(-1)  # total is unknown until the walk ends
+
+            # Directory reads are I/O bound, so several run at once on a thread pool;
+            # each finished directory contributes its rows and queues its subdirectories.
+            count = 0
+            buf: List[FileRow] = []
+            last_emit = time.monotonic()
+            executor = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4))
+            try:
+                skip_dirs = self.skip_dirs
+                pending = {executor.submit(self._scan_dir, str(root), skip_dirs)}
+                while pending:
                     if self._stop:
                         return
-                    p = Path(dirpath) / fn
-                    if p.suffix.lower() in MODEL_EXTS:
-                        candidates.append(p)
-
-            total = len(candidates)
-            if total == 0:
-                self.progress.emit(100)
+                    finished, pending = wait(pending, timeout=SCAN_BATCH_INTERVAL, return_when=FIRST_COMPLETED)
+                    for fut in finished:
+                        rows, subdirs = fut.result()
+                        for d in subdirs:
+                            pending.add(executor.submit(self._scan_dir, d, skip_dirs))
+                        buf.extend(rows)
+                        count += len(rows)
+
+                    # full batch, or don't let a slow walk sit on a partial one
+                    if buf and (len(buf) >= SCAN_BATCH_SIZE or time.monotonic() - last_emit >= SCAN_BATCH_INTERVAL):
+                        self.rows_found.emit(buf)
+                        buf = []
+                        last_emit = time.monotonic()
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+            if buf:
+                self.rows_found.emit(buf)
+
+            self.progress.emit(100)
+            if count == 0:
                 self.status.emit("Scan complete: no model files found.")
-                self.done.emit(0)
-                return
+            else:
+                self.status.emit(f"Scan complete: found {count} files.")
+            self.done.emit(count)
 
-            self.status.emit(f"Scanning: reading metadata for {total} files...")
-            for i, p in enumerate(candidates, start=1):
-                if self._stop:
-                    return
-                try:
-                    st = p.stat()
-                    row = FileRow(
-                        full_path=str(p),
-                        directory=str(p.parent),
-                        name=p.name,
-                        length=int(st.st_size),
-                        last_access_time=fmt_dt(st.st_atime),
-                        last_write_time=fmt_dt(st.st_mtime),
-                        creation_time=fmt_dt(st.st_ctime),
-                    )
-                    self.row_found.emit(row)
-                except Exception:
-                    pass
+        except Exception as e:
+            self.error.emit(f"Scan failed: {e}\n\n{traceback.format_exc()}")
 
-                self.progress.emit(int((i / total) * 100))
+    @staticmethod
+    def _scan_dir(dirpath: str, skip_dirs: frozenset) -> Tuple[List[FileRow], List[str]]:
+        """
+        Reads one directory: returns the model files in it and its subdirectories
+        (minus those named in skip_dirs).
+        """
+        # every row of this directory shares one (interned) directory string
+        dirpath = sys.intern(dirpath)
+        if _macos_scanner.available():
+            try:
+                return ScanWorker._scan_dir_bulk(dirpath, skip_dirs)
+            except OSError:
+                pass  # let scandir have a go (and skip the directory if that fails too)
+        return ScanWorker._scan_dir_scandir(dirpath, skip_dirs)
 
-            self.status.emit(f"Scan complete: found {total} files.")
-            self.done.emit(total)
+    @staticmethod
+    def _scan_dir_bulk(dirpath: str, skip_dirs: frozenset) -> Tuple[List[FileRow], List[str]]:
+        """
+        macOS: getattrlistbulk returns names, types, sizes and times for a whole
+        batch of entries per call, so regular files need no stat at all.
+        """
+        rows: List[FileRow] = []
+        subdirs: List[str] = []
+        for name, objtype, size, atime, mtime, ctime in _macos_scanner.list_dir(dirpath):
+            if objtype == _macos_scanner.VDIR:
+                if name not in skip_dirs:
+                    subdirs.append(os.path.join(dirpath, name))
+                continue
+            if not (name.endswith(MODEL_EXTS_TUPLE) or name.lower().endswith(MODEL_EXTS_TUPLE)):
+                continue
+            path = os.path.join(dirpath, name)
+            if objtype != _macos_scanner.VREG:
+                # symlinks etc.: follow them like DirEntry.stat() does
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                size, atime, mtime, ctime = st.st_size, st.st_atime, st.st_mtime, st.st_ctime
+            rows.append(FileRow(path, dirpath, name, int(size), atime, mtime, ctime))
+        return rows, subdirs
 
-        except Exception as e:
-            self.error.emit(f"Scan failed: {e}\n\n{traceback.format_exc()}")
+    @staticmethod
+    def _scan_dir_scandir(dirpath: str, skip_dirs: frozenset) -> Tuple[List[FileRow], List[str]]:
+        """
+        scandir hands back the entry type from the directory read itself,
+        so only model files are stat'ed (via statx on Linux, see stat_entry).
+        """
+        rows: List[FileRow] = []
+        subdirs: List[str] = []
+        try:
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in skip_dirs:
+                            subdirs.append(entry.path)
+                        continue
+                    name = entry.name
+                    if not (name.endswith(MODEL_EXTS_TUPLE) or name.lower().endswith(MODEL_EXTS_TUPLE)):
+                        continue
+                    try:
+                        size, atime, mtime, ctime = stat_entry(entry)
+                    except OSError:
+                        continue
+                    rows.append(FileRow(entry.path, dirpath, name, int(size), atime, mtime, ctime))
+        except OSError:
+            # unreadable / vanished directory: skip it like os.walk does
+            pass
+        return rows, subdirs
 
 
 class DeleteWorker(QThread):
@@ -183,23 +475,54 @@ class DeleteWorker(QThread):
                 self.failed.emit([])
                 return
 
-            deleter = self._delete_to_recycle_bin if self.use_recycle_bin else self._delete_permanently
             mode = "Recycle Bin" if self.use_recycle_bin else "permanent delete"
             self.status.emit(f"Deleting {total} files ({mode})...")
 
             deleted: List[str] = []
             failed: List[Tuple[str, str]] = []
 
-            for i, p in enumerate(self.paths, start=1):
-                if self._stop:
-                    return
+            if self.use_recycle_bin:
+                present = []
+                for p in self.paths:
+                    if os.path.lexists(p):
+                        present.append(p)
+                    else:
+                        failed.append((p, "File not found."))
                 try:
-                    deleter(p)
-                    deleted.append(p)
-                except Exception as e:
-                    failed.append((p, str(e)))
-
-                self.progress.emit(int((i / total) * 100))
+                    # one call for the whole list: a single shell file operation on Windows
+                    if present:
+                        self._delete_to_recycle_bin(present)
+                    deleted = present
+                    self.progress.emit(100)
+                except Exception:
+                    # redo it file by file to find out which ones failed
+                    last_pct = -1
+                    for i, p in enumerate(present, start=1):
+                        if self._stop:
+                            return
+                        try:
+                            if os.path.lexists(p):  # the bulk call may have got to it already
+                                self._delete_to_recycle_bin(p)
+                            deleted.append(p)
+                        except Exception as e:
+                            failed.append((p, str(e)))
+                        last_pct = self._emit_progress(i, len(present), last_pct)
+            else:
+                # unlinks overlap well (network shares, slow disks): run a few at once
+                last_pct = -1
+                with ThreadPoolExecutor(max_workers=8) as ex:
+                    futures = {ex.submit(self._delete_permanently, p): p for p in self.paths}
+                    for i, fut in enumerate(as_completed(futures), start=1):
+                        if self._stop:
+                            ex.shutdown(wait=False, cancel_futures=True)
+                            return
+                        p = futures[fut]
+                        exc = fut.exception()
+                        if exc is None:
+                            deleted.append(p)
+                        else:
+                            failed.append((p, str(exc)))
+                        last_pct = self._emit_progress(i, total, last_pct)
 
             self.status.emit(f"Delete finished: {len(deleted)} deleted, {len(failed)} failed.")
             self.deleted.emit(deleted)
@@ -208,12 +531,19 @@ class DeleteWorker(QThread):
         except Exception as e:
             self.error.emit(f"Delete failed: {e}\n\n{traceback.format_exc()}")
 
+    def _emit_progress(self, done: int, total: int, last_pct: int) -> int:
+        # one signal per percent, not per file: each emit is an event for the GUI thread
+        pct = int((done / total) * 100)
+        if pct != last_pct:
+            self.progress.emit(pct)
+        return pct
+
     @staticmethod
     def _delete_permanently(path: str):
         os.remove(path)
 
     @staticmethod
-    def _delete_to_recycle_bin(path: str):
+    def _delete_to_recycle_bin(path: Union[str, List[str]]):
         try:
             from send2trash import send2trash  # type: ignore
         except Exception as e:
@@ -222,258 +552,457 @@ class DeleteWorker(QThread):
                 "Install it with: pip install send2trash\n"
                 f"Original import error: {e}"
             )
-        send2trash(path)
+        send2trash(path)  # accepts a list of paths since send2trash 1.8
+
+
+class ExportWorker(QThread):
+    """
+    Writes rows of the scan results to an .xlsx file, with xlsxwriter if it is
+    installed, openpyxl otherwise. Either way the workbook is streamed, so rows go
+    to disk instead of being held as cell objects until save().
+    """
+    progress = pyqtSignal(int)
+    status = pyqtSignal(str)
+    done = pyqtSignal(str)   # file path
+    error = pyqtSignal(str)
+
+    def __init__(self, file_path: str, source: ScanResults, order: List[int], parent=None):
+        super().__init__(parent)
+        self.file_path = file_path
+        self.source = source
+        self.order = order
+
+    def run(self):
+        try:
+            self.status.emit(f"Exporting {len(self.order)} rows...")
+            self._write_xlsx()
+            self.progress.emit(100)
+            self.done.emit(self.file_path)
+        except Exception as e:
+            self.error.emit(f"Failed to write Excel file:\n{e}")
+
+    def _column_widths(self) -> List[int]:
+        """
+        Width of each column: its longest value (or header), capped at 80.
+        Worked out from the columns up front; a write-only sheet can't be read back.
+        """
+        s, order = self.source, self.order
+        longest = [len(h) for h in HEADERS]
+        if order:
+            # one C-level pass per column; directories are measured once each, not once per row
+            dirs = set(map(s.dir_ids.__getitem__, order))
+            longest[0] = max(longest[0], max(map(len, map(s.dir_table.__getitem__, dirs))))
+            longest[1] = max(longest[1], max(map(len, map(s.names.__getitem__, order))))
+            longest[2] = max(longest[2], len(str(max(map(s.sizes.__getitem__, order)))))
+            for c in (3, 4, 5):
+                longest[c] = max(longest[c], len("YYYY-MM-DD HH:MM:SS"))  # fmt_dt
+        return [min(n + 2, 80) for n in longest]
+
+    def _rows(self):
+        """
+        Export rows in order, read straight from the columns; reports progress as it goes.
+        """
+        s, order = self.source, self.order
+        dir_table, dir_ids, names, sizes = s.dir_table, s.dir_ids, s.names, s.sizes
+        atimes, mtimes, ctimes = s.atimes, s.mtimes, s.ctimes
+        total = len(order)
+        step = max(1, total // 100)
+        for n, i in enumerate(order, start=1):
+            yield (
+                dir_table[dir_ids[i]], names[i], sizes[i],
+                fmt_dt(atimes[i]), fmt_dt(mtimes[i]), fmt_dt(ctimes[i]),
+            )
+            if n % step == 0:
+                self.progress.emit(int((n / total) * 90))
+
+    def _write_xlsx(self):
+        # xlsxwriter is optional: several times faster than openpyxl for large exports
+        try:
+            import xlsxwriter  # type: ignore
+        except ImportError:
+            self._write_openpyxl()
+        else:
+            self._write_xlsxwriter(xlsxwriter)
+
+    def _write_xlsxwriter(self, xlsxwriter):
+        # constant_memory: each row is flushed to a temp file as soon as the next one starts
+        wb = xlsxwriter.Workbook(self.file_path, {"constant_memory": True})
+        try:
+            ws = wb.add_worksheet("Models")
+            ws.freeze_panes(1, 0)
+            for c, width in enumerate(self._column_widths()):
+                ws.set_column(c, c, width)
+
+            ws.write_row(0, 0, HEADERS)
+            write_row = ws.write_row
+            for r, values in enumerate(self._rows(), start=1):
+                write_row(r, 0, values)
+            self.status.emit("Saving workbook...")
+        finally:
+            wb.close()
+
+    def _write_openpyxl(self):
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Models")
+        ws.freeze_panes = "A2"
+        # column widths go out before the first row in a write-only sheet
+        for col_idx, width in enumerate(self._column_widths(), start=1):
+            ws.column_dimensions[get_column_letter(col_idx)].width = width
+
+        ws.append(HEADERS)
+        append = ws.append
+        for values in self._rows():
+            append(values)
+
+        self.status.emit("Saving workbook...")
+        wb.save(self.file_path)
+
+
+class ExcelProbeWorker(QThread):
+    """
+    Loads win32com and checks that Excel is registered, off the GUI thread.
+    Only the check runs here: a COM object belongs to the thread that created it,
+    so the Excel instance itself is dispatched later on the GUI thread.
+    """
+    done = pyqtSignal(bool)   # Excel can be launched
+
+    def run(self):
+        self.done.emit(self._probe())
+
+    @staticmethod
+    def _probe() -> bool:
+        if sys.platform != "win32":
+            return False
+        try:
+            import winreg
+            import win32com.client  # type: ignore  # noqa: F401  (pays the pyd load up front)
+            winreg.CloseKey(winreg.OpenKey(winreg.HKEY_CLASSES_ROOT, "Excel.Application"))
+        except Exception:
+            return False
+        return True
+
+
+# ---------------- Model ----------------
+
+class FileRowModel(QAbstractTableModel):
+    """
+    Table model over the scan results (no per-cell item objects).
+    `source` is the column store of all rows; `order` holds the row ids
+    (indexes into `source`) currently shown, already filtered and sorted.
+    Column 0 is the checkbox; columns 1.. are the data columns (HEADERS).
+    Check state is one byte per row id of `source`, with running count / byte totals.
+    """
+    checked_changed = pyqtSignal()
+
+    # data()/flags() run for every visible cell on each repaint: resolve the enums once
+    _ALIGN_RIGHT = int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+    _CHK_FLAGS = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsSelectable
+    _CELL_FLAGS = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+    _DISPLAY = Qt.ItemDataRole.DisplayRole
+    _EDIT = Qt.ItemDataRole.EditRole
+    _CHECK_STATE = Qt.ItemDataRole.CheckStateRole
+    _ALIGNMENT = Qt.ItemDataRole.TextAlignmentRole
+    _USER = Qt.ItemDataRole.UserRole
+    _CHECKED = Qt.CheckState.Checked
+    _UNCHECKED = Qt.CheckState.Unchecked
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.source = ScanResults()
+        self.order: List[int] = []
+        self._checked = bytearray()  # 1 = checked; only shown rows are ever checked
+        self._checked_count = 0
+        self._checked_bytes = 0
+        self._headers = ["", *HEADERS]
+
+    # ---- Qt model interface ----
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.order)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self._headers[section]
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        return self._CHK_FLAGS if index.column() == 0 else self._CELL_FLAGS
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        col = index.column()
+        i = self.order[index.row()]
+        s = self.source
+        if role == self._DISPLAY:
+            if col == 1:
+                return s.dir_of(i)
+            if col == 2:
+                return s.names[i]
+            if col == 3:
+                return s.sizes[i]
+            if col == 4:
+                return fmt_dt_cached(s.atimes[i])
+            if col == 5:
+                return fmt_dt_cached(s.mtimes[i])
+            if col == 6:
+                return fmt_dt_cached(s.ctimes[i])
+            return None
+        if role == self._CHECK_STATE and col == 0:
+            return self._CHECKED if self._checked[i] else self._UNCHECKED
+        if role == self._USER:
+            return i
+        if role == self._ALIGNMENT and col == 3:
+            return self._ALIGN_RIGHT
+        if role == self._EDIT:
+            # typed values (int / float), e.g. for sorting
+            if col == 0:
+                return s.full_paths[i]
+            if col == 1:
+                return s.dir_of(i)
+            if col == 2:
+                return s.names[i]
+            return (s.sizes, s.atimes, s.mtimes, s.ctimes)[col - 3][i]
+        return None
+
+    def setData(self, index: QModelIndex, value, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if role != Qt.ItemDataRole.CheckStateRole or index.column() != 0:
+            return False
+        i = self.order[index.row()]
+        checked = Qt.CheckState(value) == Qt.CheckState.Checked
+        if self._checked[i] == checked:
+            return True
+        self._checked[i] = checked
+        delta = 1 if checked else -1
+        self._checked_count += delta
+        self._checked_bytes += delta * self.source.sizes[i]
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        self.checked_changed.emit()
+        return True
+
+    # ---- row management ----
+
+    def set_rows(self, source: ScanResults, order: List[int], shown: Optional[bytearray] = None):
+        """
+        Shows source rows in `order`. Check marks stay on the rows that are still shown.
+        shown: mask of the ids in order, if it isn't simply every live row of source.
+        """
+        self.beginResetModel()
+        if source is self.source:
+            # rows scanned while a filter hid them were never merged into the view
+            checked = self._checked + bytes(len(source) - len(self._checked))
+        elif self._checked_count:
+            # another store (compacted after a delete): carry the marks over by path
+            paths = set(self.checked_paths())
+            checked = bytearray(map(paths.__contains__, source.full_paths))
+        else:
+            checked = bytearray(len(source))
+        if shown is None:
+            shown = source.live_mask()
+        if shown is not None and 1 in checked:
+            checked = combine_masks(and_, checked, shown)
+        self.source = source
+        self.order = order
+        self._checked = checked
+        self._checked_count = checked.count(1)
+        self._checked_bytes = sum(compress(source.sizes, checked))
+        self.endResetModel()
+
+    def _set_checked(self, checked: bool):
+        """
+        Checks (or unchecks) every shown row.
+        """
+        n = len(self.source)
+        sizes = self.source.sizes
+        if not checked:
+            self._checked = bytearray(n)
+            self._checked_count = 0
+            self._checked_bytes = 0
+            return
+        if len(self.order) == n:
+            # every row is shown: no per-row work at all
+            self._checked = bytearray(b"\x01") * n
+            self._checked_count = n
+            self._checked_bytes = sum(sizes)
+            return
+        buf = bytearray(n)
+        for i in self.order:
+            buf[i] = 1
+        self._checked = buf
+        self._checked_count = len(self.order)
+        self._checked_bytes = sum(compress(sizes, buf))
+
+    def merge_rows(self, positions: List[int], ids: List[int]):
+        """
+        Shows more rows of `source` (appended to it by the caller): ids[j] goes before
+        the row now shown at positions[j] (see insert_at).
+        """
+        if not ids:
+            return
+        self._checked.extend(bytes(len(self.source) - len(self._checked)))
+        # two signals per batch instead of one insert per row: append the new rows
+        # at the end, then move everything into place with a single layout change
+        start = len(self.order)
+        order = insert_at(self.order, positions, ids)
+        self.beginInsertRows(QModelIndex(), start, start + len(ids) - 1)
+        self.order.extend(ids)
+        self.endInsertRows()
+
+        def new_row(r: int) -> int:
+            if r >= start:
+                return positions[r - start] + r - start
+            return r + bisect_right(positions, r)
+
+        self.reorder(order, new_row)
+
+    def reorder(self, order: List[int], new_row=None):
+        """
+        Shows the same rows in a new order (a different sort): a layout change rather
+        than a reset, so the view keeps its selection and current row on the same files.
+        new_row maps a row's old position to its new one, if the caller knows it;
+        otherwise it is looked up in `order`.
+        """
+        hint = QAbstractTableModel.LayoutChangeHint.VerticalSortHint
+        self.layoutAboutToBeChanged.emit([], hint)
+        old_order = self.order
+        self.order = order
+        persistent = self.persistentIndexList()
+        if persistent:
+            if new_row is None:
+                row_of = {rid: r for r, rid in enumerate(order)}
+                new_row = lambda r: row_of[old_order[r]]
+            self.changePersistentIndexList(
+                persistent, [self.index(new_row(ix.row()), ix.column()) for ix in persistent]
+            )
+        self.layoutChanged.emit([], hint)
+
+    def visible_ids(self) -> List[int]:
+        return list(self.order)
+
+    def set_all_checked(self, checked: bool):
+        # only shown rows are ever checked, so the count says whether anything would change
+        if self._checked_count == (len(self.order) if checked else 0):
+            return
+        self._set_checked(checked)
+        if self.order:
+            self.dataChanged.emit(
+                self.index(0, 0), self.index(len(self.order) - 1, 0), [Qt.ItemDataRole.CheckStateRole]
+            )
+        self.checked_changed.emit()
+
+    def checked_paths(self) -> List[str]:
+        paths = self.source.full_paths
+        return [paths[i] for i in compress(range(len(self._checked)), self._checked)]
+
+    def checked_count_and_size(self) -> Tuple[int, int]:
+        return self._checked_count, self._checked_bytes
+
+    def set_sort_indicator(self, col: int, ascending: bool):
+        arrow = "▲" if ascending else "▼"
+        headers = ["", *HEADERS]
+        if 0 <= col < len(HEADERS):
+            headers[col + 1] = f"{HEADERS[col]} {arrow}"
+        self._headers = headers
+        self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, len(headers) - 1)
 
 
 # ---------------- Frozen Grid ----------------
 
 class FrozenGrid(QWidget):
     """
-    Left table: checkbox column frozen (always visible)
-    Right table: data columns horizontally scrollable, resizable, sortable by clicking headers (handled by MainWindow)
+    One view over a FileRowModel:
+    column 0 is a fixed-width checkbox column, the data columns are resizable
+    and sortable by clicking headers (handled by MainWindow)
     """
     checkbox_toggled = pyqtSignal()
+    header_clicked = pyqtSignal(int)  # data column index (0 = Directory)
 
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        self.left = QTableWidget(0, 1)
-        self.right = QTableWidget(0, 6)
+        self.model = FileRowModel(self)
+        self.view = QTableView()
+        self.view.setModel(self.model)
 
         layout = QHBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
-        layout.addWidget(self.left)
-        layout.addWidget(self.right, 1)
-
-        self._setup_tables()
-        self._wire_sync()
-
-    def _setup_tables(self):
-        # Left (checkbox)
-        self.left.setHorizontalHeaderLabels([""])
-        self.left.verticalHeader().setVisible(False)
-        self.left.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.left.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
-        self.left.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        self.left.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self.left.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-
-        lh = self.left.horizontalHeader()
-        lh.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
-        self.left.setColumnWidth(0, 30)
-
-        # Make left table tight (no wasted space)
-        fw = self.left.frameWidth()
-        tight = self.left.columnWidth(0) + (fw * 2) + 2
-        self.left.setMinimumWidth(tight)
-        self.left.setMaximumWidth(tight)
-
-        # Right (data)
-        self.right.setHorizontalHeaderLabels(
-            ["Directory", "Name", "Length", "LastAccessTime", "LastWriteTime", "CreationTime"]
-        )
-        self.right.verticalHeader().setVisible(False)
-        self.right.setAlternatingRowColors(True)
-        self.right.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.right.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.right.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.right.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-
-        # Allow column resizing with mouse
-        rh = self.right.horizontalHeader()
-        rh.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
-        rh.setStretchLastSection(False)
+        layout.addWidget(self.view)
+
+        self._setup_table()
+        self.model.checked_changed.connect(self.checkbox_toggled)
+        self.view.horizontalHeader().sectionClicked.connect(self._on_header_clicked)
+
+    def _setup_table(self):
+        self.view.verticalHeader().setVisible(False)
+        self.view.setAlternatingRowColors(True)
+        self.view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.view.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+
+        # Allow column resizing with mouse (except the checkbox column)
+        header = self.view.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
+        header.setStretchLastSection(False)
 
         # initial widths (user can resize)
-        self.right.setColumnWidth(0, 520)
-        self.right.setColumnWidth(1, 260)
-        self.right.setColumnWidth(2, 120)
-        self.right.setColumnWidth(3, 175)
-        self.right.setColumnWidth(4, 175)
-        self.right.setColumnWidth(5, 175)
-
-    def _wire_sync(self):
-        # sync vertical scroll
-        self.left.verticalScrollBar().valueChanged.connect(self.right.verticalScrollBar().setValue)
-        self.right.verticalScrollBar().valueChanged.connect(self.left.verticalScrollBar().setValue)
-
-        # sync row heights
-        self.left.verticalHeader().sectionResized.connect(self._sync_row_height_from_left)
-        self.right.verticalHeader().sectionResized.connect(self._sync_row_height_from_right)
-
-        # checkbox toggles
-        self.left.itemChanged.connect(self._on_left_item_changed)
-        self.left.cellPressed.connect(self._on_left_cell_pressed)
-
-        # keep left scrolled with current selection on right
-        self.right.currentCellChanged.connect(self._sync_current_row)
-
-    def _sync_row_height_from_left(self, row: int, old: int, new: int):
-        if self.right.rowCount() > row and self.right.rowHeight(row) != new:
-            self.right.setRowHeight(row, new)
-
-    def _sync_row_height_from_right(self, row: int, old: int, new: int):
-        if self.left.rowCount() > row and self.left.rowHeight(row) != new:
-            self.left.setRowHeight(row, new)
-
-    def _sync_current_row(self, currentRow: int, currentCol: int, prevRow: int, prevCol: int):
-        if currentRow >= 0:
-            it = self.left.item(currentRow, 0)
-            if it:
-                self.left.scrollToItem(it, QAbstractItemView.ScrollHint.PositionAtCenter)
-
-    def _on_left_cell_pressed(self, row: int, col: int):
-        if col == 0:
-            QTimer.singleShot(0, self.checkbox_toggled.emit)
-
-    def _on_left_item_changed(self, item: QTableWidgetItem):
-        if item.column() == 0:
-            self.checkbox_toggled.emit()
+        self.view.setColumnWidth(0, 30)
+        self.view.setColumnWidth(1, 520)
+        self.view.setColumnWidth(2, 260)
+        self.view.setColumnWidth(3, 120)
+        self.view.setColumnWidth(4, 175)
+        self.view.setColumnWidth(5, 175)
+        self.view.setColumnWidth(6, 175)
+
+    def _on_header_clicked(self, section: int):
+        if section > 0:
+            self.header_clicked.emit(section - 1)
 
     def set_sort_indicator(self, col: int, ascending: bool):
-        arrow = "▲" if ascending else "▼"
-        base = ["Directory", "Name", "Length", "LastAccessTime", "LastWriteTime", "CreationTime"]
-        base = [h.replace(" ▲", "").replace(" ▼", "") for h in base]
-        if 0 <= col < len(base):
-            base[col] = f"{base[col]} {arrow}"
-        self.right.setHorizontalHeaderLabels(base)
-
-    def clear(self):
-        self.left.blockSignals(True)
-        self.right.blockSignals(True)
-        self.left.setRowCount(0)
-        self.right.setRowCount(0)
-        self.left.blockSignals(False)
-        self.right.blockSignals(False)
+        self.model.set_sort_indicator(col, ascending)
 
     def row_count(self) -> int:
-        return self.right.rowCount()
-
-    def populate(self, rows: List[FileRow], checked_paths: set[str]):
-        self.left.blockSignals(True)
-        self.right.blockSignals(True)
-
-        self.left.setRowCount(0)
-        self.right.setRowCount(0)
+        return self.model.rowCount()
 
-        for r in rows:
-            row_idx = self.right.rowCount()
-            self.left.insertRow(row_idx)
-            self.right.insertRow(row_idx)
-
-            chk = QTableWidgetItem()
-            chk.setFlags(
-                Qt.ItemFlag.ItemIsEnabled |
-                Qt.ItemFlag.ItemIsUserCheckable |
-                Qt.ItemFlag.ItemIsSelectable
-            )
-            chk.setData(Qt.ItemDataRole.UserRole, r.full_path)
-            chk.setCheckState(Qt.CheckState.Checked if r.full_path in checked_paths else Qt.CheckState.Unchecked)
-            self.left.setItem(row_idx, 0, chk)
-
-            def set_cell(col: int, text: str, align_right: bool = False):
-                it = QTableWidgetItem(text)
-                if align_right:
-                    it.setTextAlignment(int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter))
-                self.right.setItem(row_idx, col, it)
-
-            set_cell(0, r.directory)
-            set_cell(1, r.name)
-            set_cell(2, str(r.length), align_right=True)
-            set_cell(3, r.last_access_time)
-            set_cell(4, r.last_write_time)
-            set_cell(5, r.creation_time)
-
-            h = self.right.rowHeight(row_idx)
-            self.left.setRowHeight(row_idx, h)
-
-        self.left.blockSignals(False)
-        self.right.blockSignals(False)
-
-    def append_row(self, r: FileRow, is_checked: bool = False):
+    def populate(self, rows: ScanResults, order: List[int], shown: Optional[bytearray] = None):
         """
-        Used for streaming during scan (no sorting here).
+        Shows rows[i] for each i in order (the filtered + sorted row ids); shown is the
+        filter's match mask, if any. Checked rows that are no longer shown get unchecked.
         """
-        self.left.blockSignals(True)
-        self.right.blockSignals(True)
-
-        row_idx = self.right.rowCount()
-        self.left.insertRow(row_idx)
-        self.right.insertRow(row_idx)
-
-        chk = QTableWidgetItem()
-        chk.setFlags(
-            Qt.ItemFlag.ItemIsEnabled |
-            Qt.ItemFlag.ItemIsUserCheckable |
-            Qt.ItemFlag.ItemIsSelectable
-        )
-        chk.setData(Qt.ItemDataRole.UserRole, r.full_path)
-        chk.setCheckState(Qt.CheckState.Checked if is_checked else Qt.CheckState.Unchecked)
-        self.left.setItem(row_idx, 0, chk)
-
-        self.right.setItem(row_idx, 0, QTableWidgetItem(r.directory))
-        self.right.setItem(row_idx, 1, QTableWidgetItem(r.name))
+        self.model.set_rows(rows, order, shown)
 
-        it_len = QTableWidgetItem(str(r.length))
-        it_len.setTextAlignment(int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter))
-        self.right.setItem(row_idx, 2, it_len)
-
-        self.right.setItem(row_idx, 3, QTableWidgetItem(r.last_access_time))
-        self.right.setItem(row_idx, 4, QTableWidgetItem(r.last_write_time))
-        self.right.setItem(row_idx, 5, QTableWidgetItem(r.creation_time))
+    def merge_rows(self, positions: List[int], ids: List[int]):
+        """
+        Used for streaming during scan: inserts new rows at their sorted positions.
+        """
+        self.model.merge_rows(positions, ids)
 
-        h = self.right.rowHeight(row_idx)
-        self.left.setRowHeight(row_idx, h)
+    def reorder(self, order: List[int]):
+        """
+        Same rows as shown now, in a new order.
+        """
+        self.model.reorder(order)
 
-        self.left.blockSignals(False)
-        self.right.blockSignals(False)
+    def set_all_checked(self, checked: bool):
+        self.model.set_all_checked(checked)
 
     def selected_paths(self) -> List[str]:
-        paths = []
-        for i in range(self.left.rowCount()):
-            it = self.left.item(i, 0)
-            if it and it.checkState() == Qt.CheckState.Checked:
-                p = it.data(Qt.ItemDataRole.UserRole)
-                if p:
-                    paths.append(str(p))
-        return paths
+        return self.model.checked_paths()
 
     def any_checked(self) -> bool:
-        for i in range(self.left.rowCount()):
-            it = self.left.item(i, 0)
-            if it and it.checkState() == Qt.CheckState.Checked:
-                return True
-        return False
+        return self.model.checked_count_and_size()[0] > 0
 
     def selected_count_and_size(self) -> Tuple[int, int]:
-        count = 0
-        total = 0
-        for i in range(self.right.rowCount()):
-            chk = self.left.item(i, 0)
-            if chk and chk.checkState() == Qt.CheckState.Checked:
-                count += 1
-                length_item = self.right.item(i, 2)
-                if length_item:
-                    try:
-                        total += int(length_item.text())
-                    except Exception:
-                        pass
-        return count, total
-
-    def visible_rows_as_filerows(self) -> List[FileRow]:
-        out: List[FileRow] = []
-        for i in range(self.right.rowCount()):
-            chk = self.left.item(i, 0)
-            full_path = str(chk.data(Qt.ItemDataRole.UserRole)) if chk else ""
-            directory = self.right.item(i, 0).text()
-            name = self.right.item(i, 1).text()
-            length = int(self.right.item(i, 2).text() or "0")
-            atime = self.right.item(i, 3).text()
-            mtime = self.right.item(i, 4).text()
-            ctime = self.right.item(i, 5).text()
-            out.append(FileRow(full_path, directory, name, length, atime, mtime, ctime))
-        return out
+        return self.model.checked_count_and_size()
+
+    def visible_ids(self) -> List[int]:
+        """
+        Row ids (into the populated ScanResults) in display order (honors filter + sort).
+        """
+        return self.model.visible_ids()
 
 
 # ---------------- Main Window ----------------
@@ -482,6 +1011,7 @@ class MainWindow(QMainWindow):
     MODE_IDLE = "idle"
     MODE_SCANNING = "scanning"
     MODE_DELETING = "deleting"
+    MODE_EXPORTING = "exporting"
 
     # right table column indexes
     SORT_DIRECTORY = 0
@@ -491,6 +1021,16 @@ class MainWindow(QMainWindow):
     SORT_MTIME = 4
     SORT_CTIME = 5
 
+    # sort column -> the per-row key column of ScanResults it sorts on
+    _SORT_KEYS = {
+        SORT_DIRECTORY: methodcaller("dir_sort_keys"),
+        SORT_NAME: attrgetter("names_lower"),
+        SORT_LENGTH: attrgetter("sizes"),
+        SORT_ATIME: attrgetter("atimes"),
+        SORT_MTIME: attrgetter("mtimes"),
+        SORT_CTIME: attrgetter("ctimes"),
+    }
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("ComfyUI Model Scanner")
@@ -498,19 +1038,27 @@ class MainWindow(QMainWindow):
 
         self.scan_worker: Optional[ScanWorker] = None
         self.del_worker: Optional[DeleteWorker] = None
-
-        self.all_rows: List[FileRow] = []
+        self.export_worker: Optional[ExportWorker] = None
+        self.excel_probe: Optional[ExcelProbeWorker] = None
+        # None until the startup probe answers; the Excel instance is dispatched on first use
+        self._excel_available: Optional[bool] = None
+        self._excel_app = None
+
+        self.all_rows = ScanResults()
+        # all live row ids of all_rows in sort order, and the (sort_col, sort_ascending)
+        # it was sorted by; None until the next refresh after the rows change
+        self._all_sorted: Optional[List[int]] = None
+        self._all_sorted_by: Optional[Tuple[int, bool]] = None
+        # while streaming a scan: the sort key of each shown row, ascending (in display
+        # order, or reversed when sorting descending) so new rows can be bisected in
+        self._stream_keys: list = []
         self.progress_mode = self.MODE_IDLE
 
         # default sort: LastAccessTime ascending (least accessed first)
         self.sort_col = self.SORT_ATIME
         self.sort_ascending = True
 
-        # streaming UI batching
-        self._stream_buffer: List[FileRow] = []
-        self._stream_timer = QTimer(self)
-        self._stream_timer.setInterval(150)
-        self._stream_timer.timeout.connect(self._flush_stream_buffer)
+        self.skip_dirs = SKIP_DIRS
 
         self._build_ui()
         self._wire_events()
@@ -520,6 +1068,7 @@ class MainWindow(QMainWindow):
         self._apply_sort_indicator()
         self._set_progress_mode(self.MODE_IDLE)
         self._refresh_action_states()
+        QTimer.singleShot(0, self._probe_excel)
 
     # ---------- UI ----------
 
@@ -548,7 +1097,7 @@ class MainWindow(QMainWindow):
         filter_row.addWidget(QLabel("Filter:"))
 
         self.filter_edit = QLineEdit()
-        self.filter_edit.setPlaceholderText("Type to filter by name / path / extension (e.g. 'vae' or '.safetensors')")
+        self.filter_edit.setPlaceholderText("Type to filter by name / path / extension (e.g. 'vae' or 'sdxl .safetensors')")
         filter_row.addWidget(self.filter_edit, 1)
 
         self.clear_filter_btn = QPushButton("Clear")
@@ -622,15 +1171,20 @@ class MainWindow(QMainWindow):
         self.select_all_btn.clicked.connect(self.on_select_all)
         self.select_none_btn.clicked.connect(self.on_select_none)
 
-        self.clear_filter_btn.clicked.connect(lambda: self.filter_edit.setText(""))
-        self.filter_edit.textChanged.connect(lambda: self.apply_filter_and_refresh(force=False))
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(FILTER_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(lambda: self.apply_filter_and_refresh(force=False))
+
+        self.clear_filter_btn.clicked.connect(self.on_clear_filter)
+        self.filter_edit.textChanged.connect(self._filter_timer.start)
 
         self.dir_edit.textChanged.connect(self._validate_dir_and_update_scan_button)
 
-        self.grid.checkbox_toggled.connect(self._refresh_action_states)
+        self.grid.checkbox_toggled.connect(self._on_selection_changed)
 
         # sorting by clicking headers
-        self.grid.right.horizontalHeader().sectionClicked.connect(self.on_right_header_clicked)
+        self.grid.header_clicked.connect(self.on_right_header_clicked)
 
         # theme
         self.theme_combo.currentTextChanged.connect(self.on_theme_changed)
@@ -779,6 +1333,12 @@ class MainWindow(QMainWindow):
         self.sort_ascending = bool(int(s.value("sort_ascending", 1)))
         self._apply_sort_indicator()
 
+        # a single unquoted name in the ini comes back as a plain str, a list otherwise
+        skip = s.value("scan_skip_dirs", sorted(SKIP_DIRS))
+        if isinstance(skip, str):
+            skip = skip.split(",")
+        self.skip_dirs = frozenset(d.strip() for d in (skip or []) if d.strip())
+
         self._validate_dir_and_update_scan_button()
 
     def _save_settings(self):
@@ -787,22 +1347,30 @@ class MainWindow(QMainWindow):
         s.setValue("theme", self.theme_combo.currentText())
         s.setValue("sort_col", int(self.sort_col))
         s.setValue("sort_ascending", 1 if self.sort_ascending else 0)
+        s.setValue("scan_skip_dirs", sorted(self.skip_dirs))
         s.sync()
 
     def closeEvent(self, event):
         self._save_settings()
+        # the probe can't be interrupted mid-import; a QThread must not die while running
+        if self.excel_probe is not None:
+            self.excel_probe.wait()
         super().closeEvent(event)
 
     # ---------- Progress mode ----------
 
     def _set_progress_mode(self, mode: str):
         self.progress_mode = mode
+        self.progress.setRange(0, 100)
         if mode == self.MODE_SCANNING:
             self.progress.setValue(0)
-            self.progress.setFormat("Scanning… %p%")
+            self.progress.setFormat("Scanning…")
         elif mode == self.MODE_DELETING:
             self.progress.setValue(0)
             self.progress.setFormat("Deleting… %p%")
+        elif mode == self.MODE_EXPORTING:
+            self.progress.setValue(0)
+            self.progress.setFormat("Exporting… %p%")
         else:
             self._update_progress_summary()
         self._refresh_action_states()
@@ -814,7 +1382,7 @@ class MainWindow(QMainWindow):
             self.progress.setFormat("Selected: 0 files")
         else:
             self.progress.setFormat(f"Selected: {count} files, {fmt_bytes(total_bytes)}")
-        self.progress.repaint()
+        self.progress.update()
 
     # ---------- State helpers ----------
 
@@ -872,51 +1440,67 @@ class MainWindow(QMainWindow):
             self.sort_ascending = True
 
         self._apply_sort_indicator()
-        self.apply_filter_and_refresh(force=False)
+        # same rows, new order: no need to filter again or rebuild the model.
+        # (sorted ids first, so ties come out in scan order as after a refresh)
+        self.grid.reorder(self._sort_rows(sorted(self.grid.visible_ids())))
         self._save_settings()
 
-    def _sort_rows(self, rows: List[FileRow]) -> List[FileRow]:
-        reverse = not self.sort_ascending
-
-        def key_fn(r: FileRow):
-            if self.sort_col == self.SORT_DIRECTORY:
-                return r.directory.lower()
-            if self.sort_col == self.SORT_NAME:
-                return r.name.lower()
-            if self.sort_col == self.SORT_LENGTH:
-                return r.length
-            if self.sort_col == self.SORT_ATIME:
-                return parse_dt(r.last_access_time) or datetime.min
-            if self.sort_col == self.SORT_MTIME:
-                return parse_dt(r.last_write_time) or datetime.min
-            if self.sort_col == self.SORT_CTIME:
-                return parse_dt(r.creation_time) or datetime.min
-            return r.name.lower()
-
-        return sorted(rows, key=key_fn, reverse=reverse)
+    def _sort_rows(self, order: List[int]) -> List[int]:
+        """
+        Sorts row ids (indexes into all_rows) by the current sort column.
+        """
+        return sorted(order, key=self._sort_key_fn(), reverse=not self.sort_ascending)
+
+    def _all_sorted_ids(self) -> List[int]:
+        """
+        All live row ids in the current sort order; sorted only when the sort or the rows changed.
+        """
+        state = (self.sort_col, self.sort_ascending)
+        if self._all_sorted is None or self._all_sorted_by != state:
+            self._all_sorted = self._sort_rows(self.all_rows.ids())
+            self._all_sorted_by = state
+        return self._all_sorted
+
+    def _sort_key_fn(self):
+        # every key is a lookup into a column computed once per scan (no lower() per row,
+        # no Python-level key function): numeric columns sort straight off the typed arrays
+        keys = self._SORT_KEYS.get(self.sort_col, self._SORT_KEYS[self.SORT_NAME])
+        return keys(self.all_rows).__getitem__
 
     # ---------- Filtering / refresh ----------
 
+    def on_clear_filter(self):
+        self.filter_edit.setText("")
+        self.apply_filter_and_refresh(force=False)  # no need to wait out the debounce
+
     def apply_filter_and_refresh(self, force: bool = False):
+        # this refresh covers any keystrokes still waiting on the debounce timer
+        self._filter_timer.stop()
+
         # block user-triggered refresh during scan/delete, but allow internal forced refresh
         if (self.progress_mode != self.MODE_IDLE) and (not force):
             return
 
         needle = (self.filter_edit.text() or "").strip().lower()
 
+        # filtered = row ids into all_rows. Filtering keeps the order of what it keeps,
+        # so it picks from the sorted ids instead of sorting the hits every keystroke.
+        ordered = self._all_sorted_ids()
         if not needle:
-            filtered = self.all_rows[:]
+            filtered = list(ordered)  # the model extends its order while streaming
+            hit = None
         else:
-            filtered = [r for r in self.all_rows if needle in f"{r.directory} {r.name}".lower()]
-
-        filtered = self._sort_rows(filtered)
+            hit = self.all_rows.match_mask(needle)
+            filtered = list(compress(ordered, map(hit.__getitem__, ordered)))
         self._apply_sort_indicator()
 
-        checked_before = set(self.grid.selected_paths())
-        self.grid.populate(filtered, checked_before)
+        self.grid.populate(self.all_rows, filtered, hit)
 
-        total = len(self.all_rows)
-        shown = len(filtered)
+        self._show_row_counts(len(filtered), needle)
+        self._refresh_action_states()
+
+    def _show_row_counts(self, shown: int, needle: str):
+        total = self.all_rows.live_count()
         if total == 0:
             self.status_label.setText("Ready.")
         elif needle:
@@ -924,29 +1508,6 @@ class MainWindow(QMainWindow):
         else:
             self.status_label.setText(f"Showing {shown} files.")
 
-        self._refresh_action_states()
-
-    # ---------- Streaming flush ----------
-
-    def _flush_stream_buffer(self):
-        if not self._stream_buffer:
-            return
-
-        # During scan, we stream only when filter is empty (fast + intuitive).
-        # If a filter is active, we wait for the end-of-scan full refresh.
-        needle = (self.filter_edit.text() or "").strip().lower()
-        if needle:
-            self._stream_buffer.clear()
-            return
-
-        # Append buffered rows (unsorted streaming), then final sort happens at end.
-        for r in self._stream_buffer:
-            self.grid.append_row(r, is_checked=False)
-        self._stream_buffer.clear()
-
-        # keep buttons/progress summary up to date
-        self._refresh_action_states()
-
     # ---------- Actions ----------
 
     def on_browse(self):
@@ -970,30 +1531,68 @@ class MainWindow(QMainWindow):
         self._set_progress_mode(self.MODE_SCANNING)
         self.status_label.setText("Starting scan...")
 
-        self.all_rows = []
-        self.grid.clear()
-        self._stream_buffer.clear()
-        self._stream_timer.start()
+        self.all_rows = ScanResults()
+        self._all_sorted = None
+        self._stream_keys = []
+        self.grid.populate(self.all_rows, [])
 
-        self.scan_worker = ScanWorker(root_dir)
-        self.scan_worker.progress.connect(self.progress.setValue)
+        self.scan_worker = ScanWorker(root_dir, self.skip_dirs)
+        self.scan_worker.progress.connect(self._set_progress_value)
         self.scan_worker.status.connect(self.status_label.setText)
-        self.scan_worker.row_found.connect(self.on_scan_row_found)
+        self.scan_worker.rows_found.connect(self.on_scan_rows_found)
         self.scan_worker.done.connect(self.on_scan_done)
         self.scan_worker.error.connect(self.on_worker_error)
         self.scan_worker.start()
 
-    def on_scan_row_found(self, row: FileRow):
-        self.all_rows.append(row)
-        # buffer for UI (avoid per-row repaint)
-        self._stream_buffer.append(row)
+    def on_scan_rows_found(self, rows: List[FileRow]):
+        start = len(self.all_rows)
+        self.all_rows.extend(rows)
 
-    def on_scan_done(self, total: int):
-        self._stream_timer.stop()
-        self._stream_buffer.clear()
+        # During scan, we stream only when filter is empty (fast + intuitive).
+        # If a filter is active, we wait for the end-of-scan full refresh.
+        needle = (self.filter_edit.text() or "").strip().lower()
+        if needle:
+            return
 
-        # final sorted/filtered render (restores sorting + arrows)
-        self.apply_filter_and_refresh(force=True)
+        # Keep the grid in sort order as rows arrive: only the batch is sorted, then each
+        # new row is bisected into the shown rows' keys. Ties stay in row id order (new
+        # ids are the largest), exactly what a full sort would give, so no re-sort is
+        # needed at the end.
+        # No _refresh_action_states here: while scanning every action is disabled and
+        # the selection summary is hidden; on_scan_done refreshes once at the end.
+        if self.sort_col == self.SORT_DIRECTORY:
+            # the cached directory ranks change as new directories arrive: compare names
+            dirs_lower, dir_ids = self.all_rows.dir_table_lower, self.all_rows.dir_ids
+            key_fn = lambda i: dirs_lower[dir_ids[i]]
+        else:
+            key_fn = self._sort_key_fn()
+        keys = self._stream_keys
+        n = len(keys)
+        if self.sort_ascending:
+            ids = sorted(range(start, len(self.all_rows)), key=key_fn)
+            new_keys = list(map(key_fn, ids))
+            positions = list(map(partial(bisect_right, keys), new_keys))
+            self.grid.merge_rows(positions, ids)
+        else:
+            # keys run opposite to the display here: in them, a new row goes before its
+            # ties, and position p counts from the end of the display
+            ids = sorted(range(len(self.all_rows) - 1, start - 1, -1), key=key_fn)
+            new_keys = list(map(key_fn, ids))
+            positions = list(map(partial(bisect_left, keys), new_keys))
+            self.grid.merge_rows([n - p for p in reversed(positions)], ids[::-1])
+        self._stream_keys = insert_at(keys, positions, new_keys)
+
+    def on_scan_done(self, total: int):
+        needle = (self.filter_edit.text() or "").strip().lower()
+        if needle:
+            # nothing was streamed: final filtered + sorted render
+            self.apply_filter_and_refresh(force=True)
+        else:
+            # the streamed rows are already complete and in sort order
+            self._stream_keys = []
+            self._all_sorted = self.grid.visible_ids()
+            self._all_sorted_by = (self.sort_col, self.sort_ascending)
+            self._show_row_counts(self.grid.row_count(), needle)
 
         self._set_busy(False)
         self._set_progress_mode(self.MODE_IDLE)
@@ -1002,24 +1601,12 @@ class MainWindow(QMainWindow):
     def on_select_all(self):
         if self.progress_mode != self.MODE_IDLE:
             return
-        self.grid.left.blockSignals(True)
-        for i in range(self.grid.left.rowCount()):
-            it = self.grid.left.item(i, 0)
-            if it:
-                it.setCheckState(Qt.CheckState.Checked)
-        self.grid.left.blockSignals(False)
-        self._refresh_action_states()
+        self.grid.set_all_checked(True)  # checkbox_toggled updates the actions
 
     def on_select_none(self):
         if self.progress_mode != self.MODE_IDLE:
             return
-        self.grid.left.blockSignals(True)
-        for i in range(self.grid.left.rowCount()):
-            it = self.grid.left.item(i, 0)
-            if it:
-                it.setCheckState(Qt.CheckState.Unchecked)
-        self.grid.left.blockSignals(False)
-        self._refresh_action_states()
+        self.grid.set_all_checked(False)
 
     def on_delete(self):
         if self.progress_mode != self.MODE_IDLE:
@@ -1039,7 +1626,7 @@ class MainWindow(QMainWindow):
         self.status_label.setText("Starting deletion...")
 
         self.del_worker = DeleteWorker(paths, use_recycle_bin=self.recycle_chk.isChecked())
-        self.del_worker.progress.connect(self.progress.setValue)
+        self.del_worker.progress.connect(self._set_progress_value)
         self.del_worker.status.connect(self.status_label.setText)
         self.del_worker.deleted.connect(self.on_deleted)
         self.del_worker.failed.connect(self.on_delete_failed)
@@ -1048,8 +1635,8 @@ class MainWindow(QMainWindow):
         self.del_worker.start()
 
     def on_deleted(self, deleted_paths: list):
-        deleted_set = set(deleted_paths)
-        self.all_rows = [r for r in self.all_rows if r.full_path not in deleted_set]
+        self.all_rows = self.all_rows.remove_paths(deleted_paths)
+        self._all_sorted = None
         self.apply_filter_and_refresh(force=True)
 
     def on_delete_finished(self):
@@ -1082,58 +1669,70 @@ class MainWindow(QMainWindow):
             path += ".xlsx"
 
         # export what is currently visible in the grid (honors filter + sort)
-        rows = self.grid.visible_rows_as_filerows()
-        if not rows:
+        order = self.grid.visible_ids()
+        if not order:
             return
 
-        try:
-            self._write_xlsx(path, rows)
-        except Exception as e:
-            QMessageBox.critical(self, "Export failed", f"Failed to write Excel file:\n{e}")
-            return
+        self._set_busy(True)
+        self._set_progress_mode(self.MODE_EXPORTING)
 
+        self.export_worker = ExportWorker(path, self.all_rows, order)
+        self.export_worker.progress.connect(self._set_progress_value)
+        self.export_worker.status.connect(self.status_label.setText)
+        self.export_worker.done.connect(self.on_export_done)
+        self.export_worker.error.connect(self.on_export_error)
+        self.export_worker.start()
+
+    def on_export_done(self, path: str):
+        self._set_busy(False)
+        self._set_progress_mode(self.MODE_IDLE)
+        self.status_label.setText("Exported. (Launching Excel if available...)")
         # launch Excel if available, otherwise do nothing
         self._launch_excel_if_available(path)
 
-    def _write_xlsx(self, file_path: str, rows: List[FileRow]):
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Models"
-
-        headers = ["Directory", "Name", "Length", "LastAccessTime", "LastWriteTime", "CreationTime"]
-        ws.append(headers)
-
-        for r in rows:
-            ws.append([r.directory, r.name, r.length, r.last_access_time, r.last_write_time, r.creation_time])
-
-        ws.freeze_panes = "A2"
+    def on_export_error(self, msg: str):
+        self._set_busy(False)
+        self._set_progress_mode(self.MODE_IDLE)
+        self.status_label.setText("Export failed.")
+        QMessageBox.critical(self, "Export failed", msg)
 
-        # Auto-size columns (FIXED syntax)
-        for col_idx, header in enumerate(headers, start=1):
-            c = get_column_letter(col_idx)
-            max_len = len(header)
-            for cell in ws[c]:
-                if cell.value is None:
-                    continue
-                max_len = max(max_len, len(str(cell.value)))
-            ws.column_dimensions[c].width = min(max_len + 2, 80)
+    def _probe_excel(self):
+        self.excel_probe = ExcelProbeWorker(self)
+        self.excel_probe.done.connect(self._on_excel_probed)
+        self.excel_probe.start()
 
-        wb.save(file_path)
-        self.status_label.setText("Exported. (Launching Excel if available...)")
+    def _on_excel_probed(self, available: bool):
+        self._excel_available = available
 
     def _launch_excel_if_available(self, file_path: str):
-        try:
-            import win32com.client  # type: ignore
-            excel = win32com.client.Dispatch("Excel.Application")
-            excel.Visible = True
-            excel.Workbooks.Open(os.path.abspath(file_path))
-            self.status_label.setText("Exported and opened in Excel.")
-        except Exception:
+        # an export finishing before the probe answers just checks again, inline
+        if self._excel_available is None:
+            self._excel_available = ExcelProbeWorker._probe()
+        if not self._excel_available:
             # per requirement: if Excel isn't available, do nothing extra
             self.status_label.setText("Exported.")
+            return
+        path = os.path.abspath(file_path)
+        try:
+            self._excel_workbooks().Open(path)
+        except Exception:
+            # the user may have closed the Excel we kept; start a new one once
+            self._excel_app = None
+            try:
+                self._excel_workbooks().Open(path)
+            except Exception:
+                self.status_label.setText("Exported.")
+                return
+        self.status_label.setText("Exported and opened in Excel.")
+
+    def _excel_workbooks(self):
+        if self._excel_app is None:
+            import win32com.client  # type: ignore  # already loaded by the probe
+            self._excel_app = win32com.client.Dispatch("Excel.Application")
+        self._excel_app.Visible = True
+        return self._excel_app.Workbooks
 
     def on_worker_error(self, msg: str):
-        self._stream_timer.stop()
         self._set_busy(False)
         self._set_progress_mode(self.MODE_IDLE)
         QMessageBox.critical(self, "Error", msg)
@@ -1142,12 +1741,16 @@ class MainWindow(QMainWindow):
 
     def _set_progress_mode(self, mode: str):
         self.progress_mode = mode
+        self.progress.setRange(0, 100)
         if mode == self.MODE_SCANNING:
             self.progress.setValue(0)
-            self.progress.setFormat("Scanning… %p%")
+            self.progress.setFormat("Scanning…")
         elif mode == self.MODE_DELETING:
             self.progress.setValue(0)
             self.progress.setFormat("Deleting… %p%")
+        elif mode == self.MODE_EXPORTING:
+            self.progress.setValue(0)
+            self.progress.setFormat("Exporting… %p%")
         else:
             self._update_progress_summary()
         self._refresh_action_states()
@@ -1156,7 +1759,16 @@ class MainWindow(QMainWindow):
         count, total_bytes = self.grid.selected_count_and_size()
         self.progress.setValue(100)
         self.progress.setFormat("Selected: 0 files" if count == 0 else f"Selected: {count} files, {fmt_bytes(total_bytes)}")
-        self.progress.repaint()
+        self.progress.update()
+
+    def _set_progress_value(self, value: int):
+        # -1 means "busy, total unknown": switch the bar to its marquee animation
+        if value < 0:
+            self.progress.setRange(0, 0)
+            return
+        if self.progress.maximum() == 0:
+            self.progress.setRange(0, 100)
+        self.progress.setValue(value)
 
     def _set_busy(self, busy: bool):
         self.browse_btn.setEnabled(not busy)
@@ -1197,6 +1809,14 @@ class MainWindow(QMainWindow):
         if idle:
             self._update_progress_summary()
 
+    def _on_selection_changed(self):
+        # only the selection changed: the count/size totals are kept by the model,
+        # and the folder (checked with a stat by _refresh_action_states) hasn't moved
+        if self.progress_mode != self.MODE_IDLE:
+            return
+        self.delete_btn.setEnabled(self.grid.any_checked())
+        self._update_progress_summary()
+
 
 def main():
     app = QApplication(sys.argv)